@@ -5,9 +5,21 @@ Handles SQLite database operations including initialization and CRUD operations.
 
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional, Set
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
 from contextlib import contextmanager
 
+# Stay below SQLite's default limit of 999 bound parameters per statement
+MAX_SQL_PARAMS = 900
+
+# Connection tuning for read-heavy use (view_jobs listings and exports)
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KIB = 64 * 1024
+
+
+def _casefold(text: Optional[str]) -> Optional[str]:
+    """SQL casefold(): Unicode-aware lowercasing, since SQLite only folds ASCII."""
+    return text.casefold() if text is not None else None
+
 
 class JobDatabase:
     """Manages SQLite database operations for job tracking."""
@@ -20,26 +32,46 @@ class JobDatabase:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._conn = None
         self.initialize_database()
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """
+        Context manager yielding the shared database connection.
+        
+        The connection is opened on first use and kept open, so repeated
+        calls reuse SQLite's page cache. Each block is one transaction.
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.row_factory = sqlite3.Row
+            # Safe with WAL: only the last transaction can be lost on power failure
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            # Read pages through a memory map and keep up to 64 MiB cached
+            self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            self._conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+            self._conn.create_function('casefold', 1, _casefold, deterministic=True)
         try:
-            yield conn
-            conn.commit()
+            yield self._conn
+            self._conn.commit()
         except Exception as e:
-            conn.rollback()
+            self._conn.rollback()
             raise e
-        finally:
-            conn.close()
+    
+    def close(self):
+        """Close the database connection if it is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def initialize_database(self):
         """Create jobs table if it doesn't exist."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # Write-ahead logging; persists in the database file
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
                     job_id TEXT PRIMARY KEY,
@@ -61,10 +93,15 @@ class JobDatabase:
                 ON jobs(status)
             """)
             
+            # Active-job listings filter on expired and sort/range-scan by
+            # last_seen, so one index covers both without a separate sort
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_expired 
-                ON jobs(expired)
+                CREATE INDEX IF NOT EXISTS idx_expired_last_seen 
+                ON jobs(expired, last_seen)
             """)
+            
+            # Superseded by idx_expired_last_seen, whose prefix is the same column
+            cursor.execute("DROP INDEX IF EXISTS idx_expired")
     
     def insert_job(self, job_data: Dict) -> bool:
         """
@@ -103,6 +140,61 @@ class JobDatabase:
                 # Job already exists
                 return False
     
+    def upsert_jobs(self, jobs: List[Dict], today: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Insert new jobs and refresh existing ones in a single statement.
+        
+        Args:
+            jobs: List of dictionaries containing job information
+            today: last_seen date (YYYY-MM-DD) to store, defaults to today
+            
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
+        if not jobs:
+            return 0, 0
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            today = today or datetime.now().strftime("%Y-%m-%d")
+            
+            # Count the jobs already stored so new vs. updated can be reported
+            job_ids = list({job['job_id'] for job in jobs})
+            new_count = len(job_ids)
+            for i in range(0, len(job_ids), MAX_SQL_PARAMS):
+                chunk = job_ids[i:i + MAX_SQL_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"SELECT COUNT(*) FROM jobs WHERE job_id IN ({placeholders})",
+                    chunk
+                )
+                new_count -= cursor.fetchone()[0]
+            
+            cursor.executemany("""
+                INSERT INTO jobs (
+                    job_id, title, company, location, 
+                    link, date_posted, last_seen, status, expired
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    last_seen = excluded.last_seen,
+                    expired = 0
+            """, [
+                (
+                    job['job_id'],
+                    job['title'],
+                    job['company'],
+                    job['location'],
+                    job['link'],
+                    job.get('date_posted', ''),
+                    today,
+                    'not_applied',
+                    0
+                )
+                for job in jobs
+            ])
+            
+            return new_count, len(jobs) - new_count
+    
     def update_last_seen(self, job_id: str) -> bool:
         """
         Update the last_seen date for an existing job and mark as not expired.
@@ -125,6 +217,44 @@ class JobDatabase:
             
             return cursor.rowcount > 0
     
+    def update_last_seen_bulk(self, job_ids: List[str], today: Optional[str] = None) -> int:
+        """
+        Update the last_seen date for many existing jobs in one transaction.
+        
+        Args:
+            job_ids: List of job IDs to refresh
+            today: last_seen date (YYYY-MM-DD) to store, defaults to today
+            
+        Returns:
+            Number of jobs updated
+        """
+        if not job_ids:
+            return 0
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            today = today or datetime.now().strftime("%Y-%m-%d")
+            
+            cursor.executemany("""
+                UPDATE jobs 
+                SET last_seen = ?, expired = 0
+                WHERE job_id = ?
+            """, [(today, job_id) for job_id in job_ids])
+            
+            return cursor.rowcount
+    
+    def get_all_job_ids(self) -> Set[str]:
+        """
+        Get the IDs of every job in the database, expired or not.
+        
+        Returns:
+            Set of job IDs
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT job_id FROM jobs")
+            return {row['job_id'] for row in cursor.fetchall()}
+    
     def get_all_active_job_ids(self) -> Set[str]:
         """
         Get all job IDs that are not marked as expired.
@@ -139,29 +269,34 @@ class JobDatabase:
             """)
             return {row['job_id'] for row in cursor.fetchall()}
     
-    def mark_jobs_as_expired(self, job_ids: List[str]) -> int:
+    def mark_jobs_as_expired(self, job_ids: Iterable[str]) -> int:
         """
         Mark multiple jobs as expired.
         
         Args:
-            job_ids: List of job IDs to mark as expired
+            job_ids: Job IDs to mark as expired (list, set or any iterable)
             
         Returns:
             Number of jobs marked as expired
         """
+        job_ids = list(job_ids)
         if not job_ids:
             return 0
         
+        expired_count = 0
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            placeholders = ','.join('?' * len(job_ids))
-            cursor.execute(f"""
-                UPDATE jobs 
-                SET expired = 1
-                WHERE job_id IN ({placeholders})
-            """, job_ids)
+            for i in range(0, len(job_ids), MAX_SQL_PARAMS):
+                chunk = job_ids[i:i + MAX_SQL_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    UPDATE jobs 
+                    SET expired = 1
+                    WHERE job_id IN ({placeholders})
+                """, chunk)
+                expired_count += cursor.rowcount
             
-            return cursor.rowcount
+            return expired_count
     
     def get_job_stats(self) -> Dict:
         """
@@ -173,52 +308,110 @@ class JobDatabase:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("SELECT COUNT(*) as total FROM jobs")
-            total = cursor.fetchone()['total']
-            
-            cursor.execute("SELECT COUNT(*) as active FROM jobs WHERE expired = 0")
-            active = cursor.fetchone()['active']
-            
-            cursor.execute("SELECT COUNT(*) as expired FROM jobs WHERE expired = 1")
-            expired = cursor.fetchone()['expired']
-            
             cursor.execute("""
-                SELECT COUNT(*) as applied 
-                FROM jobs WHERE status = 'applied'
+                SELECT 
+                    COUNT(*) as total,
+                    COALESCE(SUM(expired = 0), 0) as active,
+                    COALESCE(SUM(expired = 1), 0) as expired,
+                    COALESCE(SUM(status = 'applied'), 0) as applied
+                FROM jobs
             """)
-            applied = cursor.fetchone()['applied']
+            row = cursor.fetchone()
             
             return {
-                'total': total,
-                'active': active,
-                'expired': expired,
-                'applied': applied,
-                'not_applied': active - applied
+                'total': row['total'],
+                'active': row['active'],
+                'expired': row['expired'],
+                'applied': row['applied'],
+                'not_applied': row['active'] - row['applied']
             }
     
-    def export_jobs_to_dict(self, active_only: bool = True) -> List[Dict]:
+    def search_jobs(self, keyword: str, active_only: bool = True) -> List[Dict]:
         """
-        Export jobs to a list of dictionaries.
+        Find jobs whose title, company or location contains a keyword.
         
         Args:
-            active_only: If True, only export non-expired jobs
+            keyword: Case-insensitive substring to look for (also for
+                non-ASCII letters such as Å, Ä and Ö)
+            active_only: If True, only search non-expired jobs
             
         Returns:
-            List of job dictionaries
+            List of matching job dictionaries
         """
+        # Escape LIKE wildcards so the keyword is matched literally
+        pattern = '%' + keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        expired_filter = "AND expired = 0" if active_only else ""
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            if active_only:
-                cursor.execute("""
-                    SELECT * FROM jobs WHERE expired = 0
-                    ORDER BY last_seen DESC
-                """)
-            else:
-                cursor.execute("""
-                    SELECT * FROM jobs
-                    ORDER BY last_seen DESC
-                """)
+            cursor.execute(f"""
+                SELECT * FROM jobs
+                WHERE (casefold(title) LIKE casefold(:kw) ESCAPE '\\'
+                       OR casefold(company) LIKE casefold(:kw) ESCAPE '\\'
+                       OR casefold(location) LIKE casefold(:kw) ESCAPE '\\')
+                {expired_filter}
+                ORDER BY last_seen DESC
+            """, {'kw': pattern})
             
             return [dict(row) for row in cursor.fetchall()]
+    
+    def iter_jobs(self, active_only: bool = True, limit: Optional[int] = None,
+                  since: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield jobs one at a time without loading the whole table.
+        
+        Args:
+            active_only: If True, only yield non-expired jobs
+            limit: Maximum number of jobs to yield, or None for all
+            since: Only yield jobs last seen on or after this date (YYYY-MM-DD)
+            
+        Yields:
+            Job dictionaries, most recently seen first
+        """
+        query = "SELECT * FROM jobs WHERE 1=1"
+        params = []
+        if active_only:
+            query += " AND expired = 0"
+        if since:
+            query += " AND last_seen >= ?"
+            params.append(since)
+        query += " ORDER BY last_seen DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            
+            for row in cursor:
+                yield dict(row)
+    
+    def list_jobs(self, active_only: bool = True, limit: Optional[int] = None,
+                  since: Optional[str] = None) -> List[Dict]:
+        """
+        Get jobs, filtered and limited in SQL.
+        
+        Args:
+            active_only: If True, only return non-expired jobs
+            limit: Maximum number of jobs to return, or None for all
+            since: Only return jobs last seen on or after this date (YYYY-MM-DD)
+            
+        Returns:
+            List of job dictionaries, most recently seen first
+        """
+        return list(self.iter_jobs(active_only, limit, since))
+    
+    def export_jobs_to_dict(self, active_only: bool = True) -> List[Dict]:
+        """
+        Export jobs to a list of dictionaries.
+        
+        Args:
+            active_only: If True, only export non-expired jobs
+            
+        Returns:
+            List of job dictionaries
+        """
+        return list(self.iter_jobs(active_only))
 
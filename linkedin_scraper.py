@@ -4,16 +4,31 @@ LinkedIn Job Scraper
 Automated scraper that logs into LinkedIn, searches for jobs, and saves them to a database.
 """
 
-from playwright.sync_api import sync_playwright, Page
+from __future__ import annotations
+
 import time
 import os
+import sys
 import re
 import json
+import logging
+from contextlib import suppress
+from datetime import datetime
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode, quote
 from dotenv import load_dotenv
 from database import JobDatabase
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
 # Load environment variables from .env file
 load_dotenv()
+LINKEDIN_EMAIL = os.getenv('LINKEDIN_EMAIL')
+LINKEDIN_PASSWORD = os.getenv('LINKEDIN_PASSWORD')
+
+# Progress messages go through logging; output is configured in __main__
+log = logging.getLogger('scraper')
 
 # Load configuration from config.json
 def load_config():
@@ -24,7 +39,7 @@ def load_config():
             config = json.load(f)
         return config['search']
     except FileNotFoundError:
-        print("⚠️  config.json not found. Using default values.")
+        log.warning("⚠️  config.json not found. Using default values.")
         return {
             'keywords': 'data scientist',
             'location': 'Stockholm',
@@ -32,7 +47,7 @@ def load_config():
             'start_page': 1
         }
     except Exception as e:
-        print(f"⚠️  Error loading config.json: {e}. Using default values.")
+        log.warning(f"⚠️  Error loading config.json: {e}. Using default values.")
         return {
             'keywords': 'data scientist',
             'location': 'Stockholm',
@@ -47,6 +62,117 @@ SEARCH_LOCATION = config['location']
 MAX_PAGES = config['max_pages']
 START_PAGE = config.get('start_page', 1)  # Default to page 1 if not specified
 PAGE_INCREMENT = 50  # LinkedIn pagination increment (fixed)
+JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+FEED_URL = "https://www.linkedin.com/feed/"
+# Saved cookies/local storage from the last successful login
+SESSION_STATE_FILE = os.path.join(os.path.dirname(__file__), 'linkedin_state.json')
+CARD_RENDER_TIMEOUT_MS = 500  # Longest wait for a card to render after scrolling to it
+END_OF_RESULTS_OVERLAP = 0.8  # Share of job IDs repeated from the previous page
+
+# Elements that signal a page is ready, used instead of fixed sleeps
+LANDING_PAGE_SELECTOR = (
+    'button[action-type="DENY"], a[data-test-id="home-hero-sign-in-cta"], '
+    'a.sign-in-form__sign-in-cta'
+)
+LOGIN_FORM_SELECTOR = 'input#username, input[name="session_key"]'
+LOGGED_IN_SELECTOR = 'nav.global-nav'
+JOB_LIST_SELECTOR = (
+    '.jobs-search__results-list, .scaffold-layout__list-container, '
+    'ul.jobs-search-results__list'
+)
+# Job card selectors in order of preference (a list, as it is passed to the page)
+_JOB_CARD_SELECTORS = [
+    'li[data-occludable-job-id]',
+    'li.jobs-search-results__list-item',
+    'div.job-card-container'
+]
+JOB_CARD_SELECTOR = ', '.join(_JOB_CARD_SELECTORS)
+
+
+def _visible(selectors: list) -> list:
+    """Restrict each fallback selector to visible elements, keeping their order."""
+    return [f'{selector}:visible' for selector in selectors]
+
+
+# Login flow elements, as fallback selectors in priority order
+REJECT_BUTTON_SELECTORS = _visible([
+    'button[data-control-name="ga-cookie.consent.deny.v4"]',
+    'button[action-type="DENY"]',
+    'button.artdeco-global-alert-action:has-text("Reject")',
+    'button:has-text("Reject")'
+])
+SIGN_IN_LINK_SELECTORS = _visible([
+    'a[data-test-id="home-hero-sign-in-cta"]',
+    'a[data-tracking-control-name="homepage-basic_home-hero-sign-in-cta"]',
+    'a.sign-in-form__sign-in-cta',
+    'a:has-text("Sign in with email")'
+])
+USERNAME_FIELD_SELECTORS = _visible([
+    'input#username',
+    'input[name="session_key"]',
+    'input[autocomplete="username webauthn"]'
+])
+PASSWORD_FIELD_SELECTORS = _visible([
+    'input#password',
+    'input[name="session_password"]',
+    'input[type="password"]'
+])
+SIGN_IN_BUTTON_SELECTORS = _visible([
+    'button[data-litms-control-urn="login-submit"]',
+    'button[type="submit"]',
+    'button.btn__primary--large',
+    'button:has-text("Sign in")'
+])
+
+# Navigation settings; pages are only read once their DOM is parsed, so there
+# is no need to wait for every image/script to finish loading
+GOTO_TIMEOUT_MS = int(os.getenv('LINKEDIN_GOTO_TIMEOUT', '30000'))
+WAIT_UNTIL = os.getenv('LINKEDIN_WAIT_UNTIL', 'domcontentloaded')
+
+# Run without a visible window unless LINKEDIN_HEADLESS=false
+# (e.g. when LinkedIn asks for an email/SMS verification step)
+HEADLESS = os.getenv('LINKEDIN_HEADLESS', 'true').lower() != 'false'
+
+# Attach to a Chrome that is already running with --remote-debugging-port
+# instead of launching a new one, e.g. http://localhost:9222
+CDP_ENDPOINT = os.getenv('LINKEDIN_CDP_ENDPOINT')
+
+# Keep a Chrome profile here between runs (warm HTTP/JS cache and cookies).
+# Request blocking is skipped on this profile: any route disables the cache.
+USER_DATA_DIR = os.path.expanduser(os.getenv('LINKEDIN_USER_DATA_DIR', ''))
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--mute-audio',
+    # Background services a scraping session never uses
+    '--disable-sync',
+    '--disable-domain-reliability'
+]
+# Playwright always passes --disable-dev-shm-usage, which only helps in
+# containers with a tiny /dev/shm, so drop it everywhere but Linux
+IGNORED_DEFAULT_ARGS = [] if sys.platform.startswith('linux') else ['--disable-dev-shm-usage']
+
+# Requests the scraper never needs; aborted once logged in to speed up page loads.
+# Stylesheets are kept because the :visible checks depend on them.
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+BLOCKED_URL_PARTS = (
+    'doubleclick.net',
+    'googletagmanager.com',
+    'google-analytics.com',
+    'px.ads.linkedin.com'
+)
+
+# Job ID patterns, compiled once and reused for every card
+_JOB_VIEW_RE = re.compile(r'/jobs/view/(\d+)')
+_CURRENT_JOB_ID_RE = re.compile(r'currentJobId=(\d+)')
+
+# Card text cleanup: LinkedIn appends a 'with verification' badge to some fields
+_VERIFICATION_RE = re.compile(r'\s*with verification')
+_WHITESPACE_RE = re.compile(r'\s+')
 
 
 def extract_job_id(job_url: str) -> str:
@@ -59,16 +185,75 @@ def extract_job_id(job_url: str) -> str:
     Returns:
         Job ID string or None if not found
     """
-    match = re.search(r'/jobs/view/(\d+)', job_url)
+    match = _JOB_VIEW_RE.search(job_url)
     if match:
         return match.group(1)
     # Try alternative format
-    match = re.search(r'currentJobId=(\d+)', job_url)
+    match = _CURRENT_JOB_ID_RE.search(job_url)
     if match:
         return match.group(1)
     return None
 
 
+def clean_text(text: str) -> str:
+    """
+    Strip the 'with verification' badge and collapse whitespace in card text.
+    
+    Args:
+        text: Raw text read from a job card
+        
+    Returns:
+        Cleaned single-line text
+    """
+    return _WHITESPACE_RE.sub(' ', _VERIFICATION_RE.sub('', text)).strip()
+
+
+def block_unneeded_requests(route) -> None:
+    """
+    Route handler that aborts images, fonts, media and tracking requests.
+    
+    Args:
+        route: Playwright route for the intercepted request
+    """
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(part in request.url for part in BLOCKED_URL_PARTS)):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def wait_for_first_visible(page: Page, selectors: list, timeout: int):
+    """
+    Wait for the highest-priority visible element among fallback selectors.
+    
+    The fallbacks are waited on as one combined selector, so a missing
+    element costs a single timeout rather than one per fallback. Once
+    something is visible, the fallbacks are checked in order, so a broad
+    fallback never wins over a more specific selector that also matches.
+    
+    Args:
+        page: Playwright page object
+        selectors: Fallback selectors in priority order, built by _visible
+        timeout: Maximum time to wait in milliseconds
+        
+    Returns:
+        Locator for the matched element, or None if nothing became visible
+    """
+    locator = page.locator(', '.join(selectors)).first
+    try:
+        locator.wait_for(state='visible', timeout=timeout)
+    except Exception:
+        return None
+    
+    for selector in selectors:
+        match = page.locator(selector)
+        if match.count():
+            return match.first
+    # The element went away between the wait and the check; use the union
+    return locator
+
+
 def handle_cookie_consent(page: Page) -> None:
     """
     Handle LinkedIn cookie consent popup by clicking 'Reject'.
@@ -76,30 +261,21 @@ def handle_cookie_consent(page: Page) -> None:
     Args:
         page: Playwright page object
     """
-    print("Looking for Reject button...")
+    log.info("Looking for Reject button...")
     try:
-        selectors = [
-            'button[data-control-name="ga-cookie.consent.deny.v4"]',
-            'button[action-type="DENY"]',
-            'button.artdeco-global-alert-action:has-text("Reject")',
-            'button:has-text("Reject")'
-        ]
-        
-        for selector in selectors:
-            try:
-                reject_button = page.locator(selector).first
-                if reject_button.is_visible(timeout=3000):
-                    print(f"✅ Found Reject button with selector: {selector}")
-                    reject_button.click()
-                    print("✅ Clicked Reject button!")
-                    time.sleep(1)
-                    return
-            except:
-                continue
-        
-        print("ℹ️  No Reject button found (might be already dismissed)")
+        reject_button = wait_for_first_visible(page, REJECT_BUTTON_SELECTORS, timeout=3000)
+        if not reject_button:
+            log.info("ℹ️  No Reject button found (might be already dismissed)")
+            return
+        
+        log.info("✅ Found Reject button")
+        reject_button.click()
+        log.info("✅ Clicked Reject button!")
+        # Wait for the banner to go away instead of a fixed pause
+        with suppress(Exception):
+            reject_button.wait_for(state='hidden', timeout=5000)
     except Exception as e:
-        print(f"ℹ️  Could not find/click Reject button: {e}")
+        log.info(f"ℹ️  Could not find/click Reject button: {e}")
 
 
 def click_sign_in_link(page: Page) -> bool:
@@ -112,35 +288,25 @@ def click_sign_in_link(page: Page) -> bool:
     Returns:
         True if successfully clicked, False otherwise
     """
-    print("Looking for 'Sign in with email' link...")
+    log.info("Looking for 'Sign in with email' link...")
     try:
-        selectors = [
-            'a[data-test-id="home-hero-sign-in-cta"]',
-            'a[data-tracking-control-name="homepage-basic_home-hero-sign-in-cta"]',
-            'a.sign-in-form__sign-in-cta',
-            'a:has-text("Sign in with email")'
-        ]
-        
-        for selector in selectors:
-            try:
-                sign_in_link = page.locator(selector).first
-                if sign_in_link.is_visible(timeout=5000):
-                    print(f"✅ Found 'Sign in with email' link with selector: {selector}")
-                    sign_in_link.click()
-                    print("✅ Clicked 'Sign in with email' link!")
-                    
-                    # Wait for navigation to login page
-                    print("Waiting for login page to load...")
-                    page.wait_for_load_state('networkidle', timeout=10000)
-                    time.sleep(1)
-                    return True
-            except:
-                continue
-        
-        print("ℹ️  Could not find 'Sign in with email' link")
-        return False
+        sign_in_link = wait_for_first_visible(page, SIGN_IN_LINK_SELECTORS, timeout=5000)
+        if not sign_in_link:
+            log.info("ℹ️  Could not find 'Sign in with email' link")
+            return False
+        
+        log.info("✅ Found 'Sign in with email' link")
+        sign_in_link.click()
+        log.info("✅ Clicked 'Sign in with email' link!")
+        
+        # Wait for the login form itself; LinkedIn's background requests
+        # mean 'networkidle' rarely fires before its timeout
+        log.info("Waiting for login page to load...")
+        with suppress(Exception):
+            page.wait_for_selector(LOGIN_FORM_SELECTOR, timeout=10000)
+        return True
     except Exception as e:
-        print(f"ℹ️  Error clicking sign in link: {e}")
+        log.info(f"ℹ️  Error clicking sign in link: {e}")
         return False
 
 
@@ -157,50 +323,26 @@ def fill_login_credentials(page: Page, email: str, password: str) -> tuple[bool,
         Tuple of (username_filled, password_filled) booleans
     """
     # Fill in email/username field
-    username_selectors = [
-        'input#username',
-        'input[name="session_key"]',
-        'input[autocomplete="username webauthn"]'
-    ]
-    
     username_filled = False
-    for selector in username_selectors:
-        try:
-            username_field = page.locator(selector).first
-            if username_field.is_visible(timeout=5000):
-                print(f"✅ Found username field with selector: {selector}")
-                username_field.fill(email)
-                print(f"✅ Filled in email: {email}")
-                username_filled = True
-                break
-        except:
-            continue
-    
-    if not username_filled:
-        print("⚠️  Could not find username field")
+    username_field = wait_for_first_visible(page, USERNAME_FIELD_SELECTORS, timeout=5000)
+    if username_field:
+        log.info("✅ Found username field")
+        username_field.fill(email)
+        log.info(f"✅ Filled in email: {email}")
+        username_filled = True
+    else:
+        log.warning("⚠️  Could not find username field")
     
     # Fill in password field
-    password_selectors = [
-        'input#password',
-        'input[name="session_password"]',
-        'input[type="password"]'
-    ]
-    
     password_filled = False
-    for selector in password_selectors:
-        try:
-            password_field = page.locator(selector).first
-            if password_field.is_visible(timeout=5000):
-                print(f"✅ Found password field with selector: {selector}")
-                password_field.fill(password)
-                print("✅ Filled in password: ********")
-                password_filled = True
-                break
-        except:
-            continue
-    
-    if not password_filled:
-        print("⚠️  Could not find password field")
+    password_field = wait_for_first_visible(page, PASSWORD_FIELD_SELECTORS, timeout=5000)
+    if password_field:
+        log.info("✅ Found password field")
+        password_field.fill(password)
+        log.info("✅ Filled in password: ********")
+        password_filled = True
+    else:
+        log.warning("⚠️  Could not find password field")
                 
     return username_filled, password_filled
 
@@ -215,231 +357,214 @@ def click_sign_in_button(page: Page) -> bool:
     Returns:
         True if button clicked successfully, False otherwise
     """
-    print("Looking for 'Sign in' button...")
+    log.info("Looking for 'Sign in' button...")
     try:
-        selectors = [
-            'button[data-litms-control-urn="login-submit"]',
-            'button[type="submit"]',
-            'button.btn__primary--large',
-            'button:has-text("Sign in")'
-        ]
-        
-        for selector in selectors:
-            try:
-                sign_in_button = page.locator(selector).first
-                if sign_in_button.is_visible(timeout=3000):
-                    print(f"✅ Found 'Sign in' button with selector: {selector}")
-                    sign_in_button.click()
-                    print("✅ Clicked 'Sign in' button!")
-                    return True
-            except Exception as e:
-                print(f"⚠️  Error with selector {selector}: {e}")
-                continue
-        
-        print("⚠️  Could not find/click 'Sign in' button")
-        return False
+        sign_in_button = wait_for_first_visible(page, SIGN_IN_BUTTON_SELECTORS, timeout=3000)
+        if not sign_in_button:
+            log.warning("⚠️  Could not find/click 'Sign in' button")
+            return False
+        
+        log.info("✅ Found 'Sign in' button")
+        sign_in_button.click()
+        log.info("✅ Clicked 'Sign in' button!")
+        return True
     except Exception as e:
-        print(f"⚠️  Error clicking sign in button: {e}")
+        log.warning(f"⚠️  Error clicking sign in button: {e}")
         return False
 
 
-def wait_for_login(page: Page) -> None:
+def wait_for_login(page: Page) -> bool:
     """
     Wait for login process to complete.
     
     Args:
         page: Playwright page object
+        
+    Returns:
+        True if the signed-in navigation appeared, False on timeout
     """
-    print("Waiting for login to complete...")
+    log.info("Waiting for login to complete...")
     try:
-        time.sleep(5)
-        page.wait_for_load_state('domcontentloaded', timeout=20000)
-        print("✅ Login completed!")
+        # The global nav bar only renders once we're signed in
+        page.wait_for_selector(LOGGED_IN_SELECTOR, timeout=20000)
+        log.info("✅ Login completed!")
+        return True
     except Exception as e:
-        print(f"⚠️  Timeout waiting for login, but continuing anyway: {e}")
+        log.warning(f"⚠️  Timeout waiting for login, but continuing anyway: {e}")
+        return False
 
 
-def navigate_to_jobs_search(page: Page, keywords: str, location: str) -> str:
+def is_logged_in(page: Page) -> bool:
     """
-    Navigate to LinkedIn jobs search page with specified keywords and location.
+    Check whether the page's context already holds a valid LinkedIn session.
     
     Args:
         page: Playwright page object
-        keywords: Job search keywords
-        location: Job location
         
     Returns:
-        Final URL after navigation
+        True if the feed loads signed in, False if LinkedIn asks to log in
     """
-    print("\nNavigating to LinkedIn Jobs Search...")
-    page.goto("https://www.linkedin.com/jobs/search/", timeout=60000)
-    print("✅ Navigated to Jobs Search page!")
-    
-    # Wait for page to load
-    page.wait_for_load_state('domcontentloaded', timeout=20000)
-    time.sleep(2)
-    print("✅ Jobs Search page loaded!")
-    
-    # Get the current URL and append search parameters
-    current_url = page.url
-    print(f"\nCurrent URL: {current_url}")
-    
-    # Build search parameters
-    keywords_encoded = keywords.replace(' ', '%20')
-    location_encoded = location.replace(' ', '%20')
-    search_params = f"&keywords={keywords_encoded}&location={location_encoded}&refresh=true"
-    new_url = current_url + search_params
-    
-    print(f"Adding search parameters...")
-    print(f"New URL: {new_url}")
-    
-    # Navigate to the URL with search parameters
-    page.goto(new_url, timeout=60000)
-    print("✅ Navigated to search results!")
-    
-    # Wait for results to load
-    page.wait_for_load_state('domcontentloaded', timeout=20000)
-    time.sleep(2)
-    print("✅ Search results loaded!")
-    print(f"Final URL: {page.url}")
-    
-    return page.url
+    log.info("Checking saved LinkedIn session...")
+    try:
+        page.goto(FEED_URL, timeout=GOTO_TIMEOUT_MS, wait_until=WAIT_UNTIL)
+        page.wait_for_selector(LOGGED_IN_SELECTOR, timeout=10000)
+        log.info("✅ Saved session is still valid!")
+        return True
+    except Exception:
+        log.info("ℹ️  Saved session has expired, logging in again")
+        return False
 
 
-def extract_job_from_card(card, page_url: str, debug: bool = False) -> dict:
+# Selector fallbacks for the fields of a job card, tried in order
+_JOB_LINK_SELECTORS = [
+    'a.job-card-list__title',
+    'a.job-card-container__link',
+    'a[href*="/jobs/view/"]',
+    'a.scaffold-layout__list-link'
+]
+
+_COMPANY_SELECTORS = [
+    'div.artdeco-entity-lockup__subtitle',
+    '.artdeco-entity-lockup__subtitle',
+    '.job-card-container__primary-description',
+    '.job-card-container__company-name'
+]
+
+_LOCATION_SELECTORS = [
+    'div.artdeco-entity-lockup__caption ul li',
+    '.artdeco-entity-lockup__caption li',
+    '.job-card-container__metadata-item'
+]
+
+# Returns [selector, count] for the first selector that matches any job card
+_FIND_CARD_SELECTOR_JS = """
+(selectors) => {
+    for (const selector of selectors) {
+        const count = document.querySelectorAll(selector).length;
+        if (count > 0) return [selector, count];
+    }
+    return [null, 0];
+}
+"""
+
+# Scrolls every job card into view in turn so LinkedIn renders its contents,
+# moving on as soon as the card has its job link instead of after a fixed pause
+_SCROLL_JOB_CARDS_JS = """
+async ({cardSelector, timeoutMs}) => {
+    const tick = () => new Promise(resolve => setTimeout(resolve, 16));
+    for (const card of document.querySelectorAll(cardSelector)) {
+        card.scrollIntoView({block: 'center'});
+        const deadline = performance.now() + timeoutMs;
+        while (!card.querySelector('a[href*="/jobs/view/"]') && performance.now() < deadline) {
+            await tick();
+        }
+    }
+}
+"""
+
+# True once the last job card has rendered its job link (cards fill in lazily)
+_LAST_CARD_RENDERED_JS = """
+(cardSelector) => {
+    const cards = document.querySelectorAll(cardSelector);
+    const last = cards[cards.length - 1];
+    return !last || last.querySelector('a[href*="/jobs/view/"]') !== null;
+}
+"""
+
+# Reads the raw fields of every job card inside the browser in a single call,
+# instead of a Playwright round-trip per selector and attribute
+_EXTRACT_JOB_CARDS_JS = """
+({cardSelector, linkSelectors, companySelectors, locationSelectors}) => {
+    const firstMatch = (card, selectors) => {
+        for (const selector of selectors) {
+            const elem = card.querySelector(selector);
+            if (elem) return elem;
+        }
+        return null;
+    };
+    const firstText = (card, selectors) => {
+        for (const selector of selectors) {
+            const elem = card.querySelector(selector);
+            const text = elem ? elem.textContent.trim() : '';
+            if (text) return text;
+        }
+        return '';
+    };
+    return Array.from(document.querySelectorAll(cardSelector)).map(card => {
+        const link = firstMatch(card, linkSelectors);
+        const time = card.querySelector('time');
+        return {
+            job_id: card.getAttribute('data-occludable-job-id'),
+            href: link ? link.getAttribute('href') : null,
+            aria_label: link ? link.getAttribute('aria-label') : null,
+            link_text: link ? link.textContent : '',
+            company: firstText(card, companySelectors),
+            location: firstText(card, locationSelectors),
+            date_posted: time ? time.getAttribute('datetime') : null
+        };
+    });
+}
+"""
+
+
+def parse_job_card(card_data: dict, page_url: str, debug: bool = False) -> dict:
     """
-    Extract job information from a single job card element.
+    Build a job dictionary from the raw fields extracted from a job card.
     
     Args:
-        card: Playwright locator for job card
+        card_data: Raw card fields returned by _EXTRACT_JOB_CARDS_JS
         page_url: Current page URL for reference
         debug: If True, print detailed error messages
         
     Returns:
         Dictionary with job information or None if extraction fails
     """
-    try:
-        # Extract job ID from data attribute
-        job_id = card.get_attribute('data-occludable-job-id')
-        
-        # Extract job link and title
-        job_link_selectors = [
-            'a.job-card-list__title',
-            'a.job-card-container__link',
-            'a[href*="/jobs/view/"]',
-            'a.scaffold-layout__list-link'
-        ]
-        
-        job_url = None
-        title = None
-        
-        for link_selector in job_link_selectors:
-            try:
-                link = card.locator(link_selector).first
-                if link.count() > 0:
-                    job_url = link.get_attribute('href')
-                    # Prefer aria-label to avoid duplicate text
-                    title = link.get_attribute('aria-label')
-                    if not title or len(title) == 0:
-                        # Fallback to inner text
-                        title = link.inner_text().strip()
-                        # Remove duplicate text if present
-                        words = title.split('\n')
-                        if len(words) > 1 and words[0].strip() == words[1].strip():
-                            title = words[0].strip()
-                    
-                    # Clean up title
-                    if title:
-                        title = title.replace(' with verification', '')
-                        title = title.replace('\nwith verification', '')
-                        title = ' '.join(title.split())
-                    break
-            except:
-                continue
-        
-        if not job_url:
-            if debug:
-                print(f"      DEBUG: No job URL found")
-            return None
-        
-        if not title or title == "Unknown Title":
-            if debug:
-                print(f"      DEBUG: No title found (job_url: {job_url[:50]}...)")
-            return None
-        
-        # Extract job ID if not found in data attribute
-        if not job_id:
-            job_id = extract_job_id(job_url)
-        if not job_id:
-            if debug:
-                print(f"      DEBUG: Could not extract job_id from URL: {job_url[:50]}...")
-            return None
-        
-        # Extract company name
-        company_selectors = [
-            'div.artdeco-entity-lockup__subtitle',
-            '.artdeco-entity-lockup__subtitle',
-            '.job-card-container__primary-description',
-            '.job-card-container__company-name'
-        ]
-        
-        company = "Unknown"
-        for selector in company_selectors:
-            try:
-                elem = card.locator(selector).first
-                if elem.count() > 0:
-                    company = elem.inner_text().strip()
-                    if company:
-                        company = ' '.join(company.split())
-                        company = company.replace(' with verification', '')
-                    if company and company != "Unknown" and len(company) > 0:
-                        break
-            except:
-                continue
-        
-        # Extract location
-        location_selectors = [
-            'div.artdeco-entity-lockup__caption ul li',
-            '.artdeco-entity-lockup__caption li',
-            '.job-card-container__metadata-item'
-        ]
-        
-        location = "Unknown"
-        for selector in location_selectors:
-            try:
-                elem = card.locator(selector).first
-                if elem.count() > 0:
-                    location = elem.inner_text().strip()
-                    if location:
-                        location = ' '.join(location.split())
-                    if location and len(location) > 0:
-                        break
-            except:
-                continue
-        
-        # Extract posted date
-        posted_date = None
-        try:
-            posted_elem = card.locator('time')
-            if posted_elem.count() > 0:
-                posted_date = posted_elem.first.get_attribute('datetime')
-        except:
-            pass
-        
-        return {
-            'job_id': job_id,
-            'title': title,
-            'company': company,
-            'location': location,
-            'link': f"https://www.linkedin.com/jobs/view/{job_id}",
-            'date_posted': posted_date,
-            'description': '',
-            'search_url': page_url
-        }
-    except Exception as e:
+    job_url = card_data.get('href')
+    if not job_url:
         if debug:
-            print(f"      DEBUG: Exception extracting job: {e}")
+            log.debug(f"      DEBUG: No job URL found")
         return None
+    
+    # Prefer aria-label to avoid duplicate text
+    title = card_data.get('aria_label')
+    if not title:
+        # Fallback to the link text
+        title = (card_data.get('link_text') or '').strip()
+        # Remove duplicate text if present (textContent keeps the markup's
+        # blank lines, so compare the non-empty ones)
+        words = [line.strip() for line in title.split('\n') if line.strip()]
+        if len(words) > 1 and words[0] == words[1]:
+            title = words[0]
+    
+    # Clean up title
+    if title:
+        title = clean_text(title)
+    
+    if not title or title == "Unknown Title":
+        if debug:
+            log.debug(f"      DEBUG: No title found (job_url: {job_url[:50]}...)")
+        return None
+    
+    # Extract job ID from the URL if the card had no data attribute
+    job_id = card_data.get('job_id') or extract_job_id(job_url)
+    if not job_id:
+        if debug:
+            log.debug(f"      DEBUG: Could not extract job_id from URL: {job_url[:50]}...")
+        return None
+    
+    company = clean_text(card_data.get('company', '')) or "Unknown"
+    location = clean_text(card_data.get('location', '')) or "Unknown"
+    
+    return {
+        'job_id': job_id,
+        'title': title,
+        'company': company,
+        'location': location,
+        'link': f"https://www.linkedin.com/jobs/view/{job_id}",
+        'date_posted': card_data.get('date_posted'),
+        'description': '',
+        'search_url': page_url
+    }
 
 
 def scrape_jobs_from_page(page: Page) -> list:
@@ -456,180 +581,210 @@ def scrape_jobs_from_page(page: Page) -> list:
     
     try:
         # Wait for job list to load
-        job_list_selectors = [
-            '.jobs-search__results-list',
-            '.scaffold-layout__list-container',
-            'ul.jobs-search-results__list'
-        ]
-        
-        for selector in job_list_selectors:
-            try:
-                page.wait_for_selector(selector, timeout=5000)
-                print(f"  ✅ Found job list with selector: {selector}")
-                break
-            except:
-                continue
-        
-        time.sleep(3)  # Let page fully settle
+        with suppress(Exception):
+            page.wait_for_selector(JOB_LIST_SELECTOR, timeout=10000)
+            log.info("  ✅ Found job list")
+        
+        # Wait for the first card to render rather than a fixed settle time
+        with suppress(Exception):
+            page.wait_for_selector(JOB_CARD_SELECTOR, timeout=10000)
         
         # Find all job cards first
-        print("  🔄 Loading all job cards...")
-        
-        # Find all job cards
-        job_card_selectors = [
-            'li[data-occludable-job-id]',
-            'li.jobs-search-results__list-item',
-            'div.job-card-container'
-        ]
-        
-        job_cards = None
-        for selector in job_card_selectors:
-            cards = page.locator(selector).all()
-            if len(cards) > 0:
-                job_cards = cards
-                print(f"  📋 Found {len(job_cards)} job cards with selector: {selector}")
-                break
-        
-        if not job_cards:
-            print("  ⚠️  Could not find any job cards")
+        log.info("  🔄 Loading all job cards...")
+        
+        # Pick the first selector that matches any cards in one browser call
+        card_selector, card_count = page.evaluate(_FIND_CARD_SELECTOR_JS, _JOB_CARD_SELECTORS)
+        if not card_selector:
+            log.warning("  ⚠️  Could not find any job cards")
             return jobs
+        log.info(f"  📋 Found {card_count} job cards with selector: {card_selector}")
+        
+        # Scroll through each job card to trigger lazy loading, in one browser call
+        log.info(f"  📜 Scrolling through {card_count} cards to trigger lazy loading...")
+        # If scrolling fails, continue anyway
+        with suppress(Exception):
+            page.evaluate(_SCROLL_JOB_CARDS_JS, {
+                'cardSelector': card_selector,
+                'timeoutMs': CARD_RENDER_TIMEOUT_MS
+            })
+        
+        log.info(f"  ✅ Finished scrolling, waiting for content to load...")
+        # Wait until the last card has rendered its job link
+        with suppress(Exception):
+            page.wait_for_function(_LAST_CARD_RENDERED_JS, arg=card_selector, timeout=5000)
+        
+        # Extract information from all job cards in one browser call
+        cards_data = page.evaluate(_EXTRACT_JOB_CARDS_JS, {
+            'cardSelector': card_selector,
+            'linkSelectors': _JOB_LINK_SELECTORS,
+            'companySelectors': _COMPANY_SELECTORS,
+            'locationSelectors': _LOCATION_SELECTORS
+        })
         
-        # Scroll through each job card to trigger lazy loading
-        print(f"  📜 Scrolling through {len(job_cards)} cards to trigger lazy loading...")
-        for idx, card in enumerate(job_cards):
-            try:
-                # Scroll the card into view
-                card.scroll_into_view_if_needed()
-                # Small delay to let content load
-                time.sleep(0.3)
-            except Exception as e:
-                # If scrolling fails, continue anyway
-                pass
-        
-        print(f"  ✅ Finished scrolling, waiting for content to load...")
-        time.sleep(2)  # Give extra time for any final loading
-        
-        # Extract information from each job card
         failed_count = 0
-        for idx, card in enumerate(job_cards, 1):
+        for idx, card_data in enumerate(cards_data, 1):
             # Enable debug for first 3 failed extractions
             debug = (failed_count < 3)
-            job_data = extract_job_from_card(card, page.url, debug=debug)
+            job_data = parse_job_card(card_data, page.url, debug=debug)
             if job_data:
                 jobs.append(job_data)
                 title_display = job_data['title'][:50] + ('...' if len(job_data['title']) > 50 else '')
-                print(f"    ✅ {idx}. {title_display} at {job_data['company']}")
+                log.debug(f"    ✅ {idx}. {title_display} at {job_data['company']}")
             else:
                 failed_count += 1
-                print(f"    ⚠️  Skipping job {idx} - could not extract data")
+                log.warning(f"    ⚠️  Skipping job {idx} - could not extract data")
     
     except Exception as e:
-        print(f"  ❌ Error scraping page: {e}")
+        log.error(f"  ❌ Error scraping page: {e}")
     
     return jobs
 
 
-def save_jobs_to_database(jobs: list, db: JobDatabase) -> tuple[int, int]:
+def save_jobs_to_database(jobs: list, db: JobDatabase, known_job_ids: set = None,
+                          scrape_date: str = None) -> tuple[int, int]:
     """
     Save scraped jobs to database.
     
+    Jobs already in known_job_ids only have their last_seen date refreshed;
+    the rest are upserted.
+    
     Args:
         jobs: List of job dictionaries
         db: JobDatabase instance
+        known_job_ids: Set of stored job IDs, updated with newly inserted ones
+        scrape_date: last_seen date (YYYY-MM-DD) shared by the whole run
         
     Returns:
         Tuple of (new_count, updated_count)
     """
-    new_count = 0
-    updated_count = 0
-    
+    known = known_job_ids if known_job_ids is not None else set()
+    # Keyed by job_id so a card listed twice only reaches the database once
+    seen_ids = {}
+    new_jobs = {}
     for job in jobs:
-        if db.insert_job(job):
-            new_count += 1
+        if job['job_id'] in known:
+            seen_ids[job['job_id']] = None
         else:
-            db.update_last_seen(job['job_id'])
-            updated_count += 1
+            new_jobs[job['job_id']] = job
+    
+    new_count, updated_count = db.upsert_jobs(list(new_jobs.values()), scrape_date)
+    updated_count += db.update_last_seen_bulk(list(seen_ids), scrape_date)
+    
+    if known_job_ids is not None:
+        known_job_ids.update(new_jobs)
     
     return new_count, updated_count
 
 
-def scrape_multiple_pages(page: Page, base_url: str, db: JobDatabase, 
-                         max_pages: int, page_increment: int, start_page: int = 1) -> list:
+def build_page_urls(keywords: str, location: str, max_pages: int, start_page: int = 1) -> list:
+    """
+    Build the URL of every results page of a job search.
+    
+    Args:
+        keywords: Job search keywords
+        location: Job location
+        max_pages: Number of pages to build
+        start_page: Page number of the first URL (1-based, default: 1)
+        
+    Returns:
+        List of search results URLs, one per page
+    """
+    query = urlencode(
+        {'keywords': keywords, 'location': location, 'refresh': 'true'},
+        quote_via=quote
+    )
+    return [
+        f"{JOBS_SEARCH_URL}?{query}&start={(start_page - 1 + i) * PAGE_INCREMENT}"
+        for i in range(max_pages)
+    ]
+
+
+def scrape_multiple_pages(page: Page, page_urls: list, db: JobDatabase,
+                          start_page: int = 1) -> int:
     """
     Scrape jobs from multiple pages with pagination.
     
+    Each page is written to the database before the next one is loaded, so
+    only one page of job dicts is held in memory at a time.
+    
     Args:
         page: Playwright page object
-        base_url: Base URL for pagination
+        page_urls: Search results URLs to visit, one per page, in order
         db: JobDatabase instance
-        max_pages: Maximum number of pages to scrape
-        page_increment: Number to increment 'start' parameter by
-        start_page: Page number to start from (1-based, default: 1)
+        start_page: Page number of the first URL (1-based, default: 1)
         
     Returns:
-        List of all scraped jobs
+        Total number of jobs scraped
     """
-    all_jobs = []
-    # Convert start_page (1-based) to start_value (0-based, in increments of page_increment)
-    start_value = (start_page - 1) * page_increment
+    total_jobs = 0
+    # Jobs already in the database only need their last_seen refreshed
+    known_job_ids = db.get_all_job_ids()
+    # One last_seen date for the whole run, even if it crosses midnight
+    scrape_date = datetime.now().strftime("%Y-%m-%d")
     pages_scraped = 0
+    previous_ids = set()
+    # Jobs already saved during this run; repeats on later pages are skipped
+    run_ids = set()
     
-    # Remove existing start parameter from base URL
-    base_url = base_url.split('&start=')[0] if '&start=' in base_url else base_url
-    
-    for page_num in range(max_pages):
-        current_page_number = start_page + page_num
-        print(f"\n📄 Scraping page {current_page_number} (start={start_value})...")
-        
-        # Build URL with current start value
-        if '?' in base_url:
-            current_url = f"{base_url}&start={start_value}"
-        else:
-            current_url = f"{base_url}?start={start_value}"
+    for current_page_number, current_url in enumerate(page_urls, start_page):
+        log.info(f"\n📄 Scraping page {current_page_number}...")
+        log.debug(f"  URL: {current_url}")
         
         # Navigate to page
         try:
-            page.goto(current_url, timeout=60000)
-            page.wait_for_load_state('domcontentloaded', timeout=20000)
-            time.sleep(2)
+            page.goto(current_url, timeout=GOTO_TIMEOUT_MS, wait_until=WAIT_UNTIL)
         except Exception as e:
-            print(f"  ⚠️  Error navigating to page: {e}")
+            log.warning(f"  ⚠️  Error navigating to page: {e}")
             break
         
         # Scrape jobs from current page
         jobs_on_page = scrape_jobs_from_page(page)
         
         if not jobs_on_page:
-            print("  ℹ️  No jobs found on this page. Reached end of results.")
+            log.info("  ℹ️  No jobs found on this page. Reached end of results.")
             break
         
-        all_jobs.extend(jobs_on_page)
+        # Past the last page LinkedIn keeps showing the previous results
+        page_ids = {job['job_id'] for job in jobs_on_page}
+        if len(page_ids & previous_ids) > END_OF_RESULTS_OVERLAP * len(page_ids):
+            log.info("  ℹ️  Page repeats the previous results. Reached end of results.")
+            break
+        previous_ids = page_ids
+        
+        # Keyed by job_id so a job listed twice on this page is counted once too
+        jobs_on_page = list({
+            job['job_id']: job for job in jobs_on_page if job['job_id'] not in run_ids
+        }.values())
+        run_ids |= page_ids
+        # Nothing new for this run means LinkedIn has wrapped around to earlier pages
+        if not jobs_on_page:
+            log.info("  ℹ️  Page only repeats jobs from earlier pages. Reached end of results.")
+            break
+        total_jobs += len(jobs_on_page)
         pages_scraped += 1
         
         # Save to database
-        print(f"  💾 Saving {len(jobs_on_page)} jobs to database...")
-        new_count, updated_count = save_jobs_to_database(jobs_on_page, db)
-        print(f"  ✅ Page {current_page_number}: {new_count} new, {updated_count} updated")
+        log.info(f"  💾 Saving {len(jobs_on_page)} jobs to database...")
+        new_count, updated_count = save_jobs_to_database(jobs_on_page, db, known_job_ids, scrape_date)
+        log.info(f"  ✅ Page {current_page_number}: {new_count} new, {updated_count} updated")
         
-        # Move to next page
-        start_value += page_increment
         time.sleep(2)  # Delay between pages
     
-    return all_jobs
+    return total_jobs
 
                                     
-def print_summary(all_jobs: list, db: JobDatabase) -> None:
+def print_summary(total_jobs: int, db: JobDatabase) -> None:
     """
     Print scraping summary statistics.
     
     Args:
-        all_jobs: List of all scraped jobs
+        total_jobs: Number of jobs scraped in this run
         db: JobDatabase instance
     """
     print("\n" + "="*60)
     print("📊 Scraping Summary")
     print("="*60)
-    print(f"  Total jobs found:    {len(all_jobs)}")
+    print(f"  Total jobs found:    {total_jobs}")
     
     stats = db.get_job_stats()
     print(f"\n  Total in database:   {stats['total']}")
@@ -655,125 +810,213 @@ def login_to_linkedin(page: Page) -> bool:
     if not click_sign_in_link(page):
         return False
     
-    # Get credentials
-    print("Filling in login credentials...")
-    email = os.getenv('LINKEDIN_EMAIL')
-    password = os.getenv('LINKEDIN_PASSWORD')
-    
-    if not email or not password:
-        print("⚠️  WARNING: LINKEDIN_EMAIL or LINKEDIN_PASSWORD not found in .env file")
-        print("Please create a .env file with your credentials.")
+    log.info("Filling in login credentials...")
+    if not (LINKEDIN_EMAIL and LINKEDIN_PASSWORD):
+        log.warning("⚠️  WARNING: LINKEDIN_EMAIL or LINKEDIN_PASSWORD not found in .env file")
+        log.warning("Please create a .env file with your credentials.")
         return False
     
     # Fill in credentials
-    username_filled, password_filled = fill_login_credentials(page, email, password)
+    username_filled, password_filled = fill_login_credentials(
+        page, LINKEDIN_EMAIL, LINKEDIN_PASSWORD
+    )
     
     if not (username_filled and password_filled):
-        print("⚠️  Could not fill in login credentials")
+        log.warning("⚠️  Could not fill in login credentials")
         return False
     
-    print("✅ Login form filled successfully!")
+    log.info("✅ Login form filled successfully!")
     
     # Click sign in button
     if not click_sign_in_button(page):
         return False
     
-    # Wait for login to complete
-    wait_for_login(page)
+    # Wait for login to complete, and keep the session for the next run
+    if wait_for_login(page):
+        # Holds live session cookies, so only the owner may read it; created
+        # with 0600 and tightened in case an older, looser file is replaced
+        state = page.context.storage_state()
+        fd = os.open(SESSION_STATE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(state, f)
+        os.chmod(SESSION_STATE_FILE, 0o600)
+        log.info(f"💾 Saved LinkedIn session to {SESSION_STATE_FILE}")
     
     return True
 
 
-def main():
-    """Main execution function."""
+def _launch_chrome(launch, *args):
+    """
+    Call a Playwright launch method with system Chrome, falling back to Chromium.
+    
+    Args:
+        launch: p.chromium.launch or p.chromium.launch_persistent_context
+        *args: Positional arguments passed through to launch
+        
+    Returns:
+        Whatever launch returns (Browser or BrowserContext)
+    """
+    try:
+        result = launch(*args, headless=HEADLESS, channel="chrome", args=BROWSER_ARGS,
+                        ignore_default_args=IGNORED_DEFAULT_ARGS)
+        log.info("✅ Using system Chrome")
+    except Exception as e:
+        log.warning(f"⚠️  Could not use system Chrome: {e}")
+        result = launch(*args, headless=HEADLESS, args=BROWSER_ARGS,
+                        ignore_default_args=IGNORED_DEFAULT_ARGS)
+        log.info("✅ Using Chromium")
+    return result
+
+
+def open_browser_context(p):
+    """
+    Start Chrome and return the browser context to scrape in.
+    
+    With CDP_ENDPOINT set, attaches to an already running Chrome. With
+    USER_DATA_DIR set, runs on a persistent profile so cookies, HTTP cache and
+    compiled JS survive between runs. Otherwise launches a fresh browser and
+    loads the saved session state, if any.
+    
+    A persistent-profile context comes with its first tab already open; use
+    context.pages[0] rather than opening another.
+    
+    Args:
+        p: Playwright instance from sync_playwright()
+        
+    Returns:
+        Tuple of (context, has_session) where has_session says whether the
+        context may already be logged in
+    """
+    if USER_DATA_DIR and not CDP_ENDPOINT:
+        # A brand-new profile directory can't hold a login yet
+        has_session = os.path.isdir(USER_DATA_DIR)
+        log.info(f"Starting Chrome with profile {USER_DATA_DIR}...")
+        context = _launch_chrome(p.chromium.launch_persistent_context, USER_DATA_DIR)
+        log.info("✅ Browser launched successfully!")
+        return context, has_session
+    
+    if CDP_ENDPOINT:
+        log.info(f"Connecting to running Chrome at {CDP_ENDPOINT}...")
+        browser = p.chromium.connect_over_cdp(CDP_ENDPOINT)
+        log.info("✅ Connected to Chrome!")
+    else:
+        log.info("Starting Chrome...")
+        browser = _launch_chrome(p.chromium.launch)
+        log.info("✅ Browser launched successfully!")
+    
+    # Reuse the saved session cookies if we have them
+    has_session = os.path.exists(SESSION_STATE_FILE)
+    context = browser.new_context(
+        storage_state=SESSION_STATE_FILE if has_session else None
+    )
+    return context, has_session
+
+
+def main(keywords: str = SEARCH_KEYWORDS, location: str = SEARCH_LOCATION,
+         max_pages: int = MAX_PAGES, start_page: int = START_PAGE) -> int:
+    """
+    Main execution function.
+    
+    Defaults to the search in config.json; pass arguments to run another
+    search when importing this module.
+    
+    Args:
+        keywords: Job search keywords
+        location: Job location
+        max_pages: Maximum number of pages to scrape
+        start_page: Page number to start from (1-based)
+        
+    Returns:
+        Number of jobs scraped
+    """
     print("="*60)
     print("🔗 LinkedIn Job Scraper")
     print("="*60)
-    print(f"\nSearching for: {SEARCH_KEYWORDS}")
-    print(f"Location: {SEARCH_LOCATION}")
-    print(f"Starting from page: {START_PAGE}")
-    print(f"Max pages: {MAX_PAGES}\n")
+    print(f"\nSearching for: {keywords}")
+    print(f"Location: {location}")
+    print(f"Starting from page: {start_page}")
+    print(f"Max pages: {max_pages}\n")
+    
+    # Every results page is known up front, no URL parsing while scraping
+    page_urls = build_page_urls(keywords, location, max_pages, start_page)
+    total_jobs = 0
+    
+    # Without credentials we can only get in through an existing session,
+    # so don't launch a browser that is bound to stop at the login form.
+    # A CDP connection opens a fresh context, so only the saved state counts there.
+    may_have_session = (os.path.exists(SESSION_STATE_FILE)
+                        or (USER_DATA_DIR and not CDP_ENDPOINT and os.path.isdir(USER_DATA_DIR)))
+    if not (LINKEDIN_EMAIL and LINKEDIN_PASSWORD) and not may_have_session:
+        log.error("❌ LINKEDIN_EMAIL or LINKEDIN_PASSWORD not found in .env file")
+        log.error("Please create a .env file with your credentials.")
+        return total_jobs
+    
+    # Imported here so helpers can be imported without loading Playwright
+    from playwright.sync_api import sync_playwright
     
     try:
         with sync_playwright() as p:
-            # Launch browser
-            print("Starting Chrome...")
-            try:
-                browser = p.chromium.launch(
-                    headless=False,
-                    channel="chrome",
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-blink-features=AutomationControlled'
-                    ]
-                )
-                print("✅ Using system Chrome")
-            except Exception as e:
-                print(f"⚠️  Could not use system Chrome: {e}")
-                browser = p.chromium.launch(
-                    headless=False,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-blink-features=AutomationControlled'
-                    ]
-                )
-                print("✅ Using Chromium")
-            
-            print("✅ Browser launched successfully!")
-            
-            # Create page
-            print("Creating new page...")
-            page = browser.new_page()
-            print("✅ Page created successfully!")
-            
-            # Navigate to LinkedIn
-            print("Navigating to LinkedIn...")
-            page.goto("https://www.linkedin.com", timeout=60000)
-            print("✅ Successfully loaded LinkedIn!")
+            context, has_session = open_browser_context(p)
+            # A persistent-profile context owns its browser and has none to close
+            persistent_profile = context.browser is None
             
-            time.sleep(2)
+            log.info("Creating new page...")
+            page = context.pages[0] if context.pages else context.new_page()
+            log.info("✅ Page created successfully!")
             
-            # Login to LinkedIn
-            if not login_to_linkedin(page):
-                print("❌ Login failed")
-                return
+            if not (has_session and is_logged_in(page)):
+                # Navigate to LinkedIn
+                log.info("Navigating to LinkedIn...")
+                page.goto("https://www.linkedin.com", timeout=GOTO_TIMEOUT_MS, wait_until=WAIT_UNTIL)
+                log.info("✅ Successfully loaded LinkedIn!")
+                
+                # Wait for the cookie banner or sign-in link before logging in
+                with suppress(Exception):
+                    page.wait_for_selector(LANDING_PAGE_SELECTOR, timeout=10000)
+                
+                # Login to LinkedIn
+                if not login_to_linkedin(page):
+                    log.error("❌ Login failed")
+                    return total_jobs
             
-            # Navigate to jobs search
-            final_url = navigate_to_jobs_search(page, SEARCH_KEYWORDS, SEARCH_LOCATION)
+            # Logged in - from here on only the page DOM matters. Playwright
+            # turns the HTTP cache off for routed contexts, so a persistent
+            # profile keeps its warm cache instead of blocking requests.
+            if not persistent_profile:
+                context.route("**/*", block_unneeded_requests)
             
             # Initialize database
-            print("\n💾 Initializing database...")
+            log.info("\n💾 Initializing database...")
             db = JobDatabase()
-            print("✅ Database ready")
+            log.info("✅ Database ready")
             
             # Scrape jobs with pagination
-            print("\n🔍 Starting job scraping...")
-            all_jobs = scrape_multiple_pages(page, final_url, db, MAX_PAGES, PAGE_INCREMENT, START_PAGE)
+            log.info("\n🔍 Starting job scraping...")
+            total_jobs = scrape_multiple_pages(page, page_urls, db, start_page)
             
             # Print summary
-            print_summary(all_jobs, db)
+            print_summary(total_jobs, db)
+            db.close()
             
-            # Keep browser open briefly
-            print("\n✅ Scraping complete!")
-            print("Browser will close in 10 seconds...")
-            for i in range(10, 0, -1):
-                print(f"  Closing in {i} seconds...", end='\r')
-                time.sleep(1)
-            print("\n👋 Closing browser...")        
+            log.info("\n✅ Scraping complete!")
+            log.info("👋 Closing browser...")
+            if persistent_profile:
+                context.close()
+            else:
+                context.browser.close()
             
     except KeyboardInterrupt:
-        print("\n\n👋 User interrupted - closing browser...")
+        log.info("\n\n👋 User interrupted - closing browser...")
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"\n❌ Error: {e}")
     finally:
-        print("✅ Done!")
+        log.info("✅ Done!")
+    
+    return total_jobs
 
 
 if __name__ == "__main__":
+    # Same stream as the print() banner and summary; LOG_LEVEL=DEBUG adds per-card output
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s',
+                        stream=sys.stdout)
     main()
@@ -4,27 +4,62 @@ Interactive database viewer for job listings.
 Quick way to view and explore your scraped jobs.
 """
 
+from __future__ import annotations
+
 import sys
 import argparse
-from datetime import datetime, timedelta
-from database import JobDatabase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from database import JobDatabase
+
+
+_JOB_TEMPLATE = (
+    "\n{prefix}{rule}\n"
+    "Title:    {title}{expired_tag}{applied_tag}\n"
+    "Company:  {company}\n"
+    "Location: {location}\n"
+    "Posted:   {date_posted}\n"
+    "Last Seen: {last_seen}\n"
+    "Status:   {status}\n"
+    "Link:     {link}\n"
+    "Job ID:   {job_id}\n"
+)
 
 
 def print_job(job: dict, index: int = None):
     """Print a single job in a nice format."""
-    prefix = f"[{index}] " if index is not None else ""
-    expired_tag = " [EXPIRED]" if job.get('expired') else ""
-    applied_tag = f" [APPLIED: {job['applied_on']}]" if job.get('applied_on') else ""
-    
-    print(f"\n{prefix}{'='*70}")
-    print(f"Title:    {job['title']}{expired_tag}{applied_tag}")
-    print(f"Company:  {job['company']}")
-    print(f"Location: {job['location']}")
-    print(f"Posted:   {job.get('date_posted', 'N/A')}")
-    print(f"Last Seen: {job['last_seen']}")
-    print(f"Status:   {job['status']}")
-    print(f"Link:     {job['link']}")
-    print(f"Job ID:   {job['job_id']}")
+    # One write per job instead of one print() per line
+    sys.stdout.write(_JOB_TEMPLATE.format(
+        prefix=f"[{index}] " if index is not None else "",
+        rule='='*70,
+        title=job['title'],
+        expired_tag=" [EXPIRED]" if job.get('expired') else "",
+        applied_tag=f" [APPLIED: {job['applied_on']}]" if job.get('applied_on') else "",
+        company=job['company'],
+        location=job['location'],
+        date_posted=job.get('date_posted', 'N/A'),
+        last_seen=job['last_seen'],
+        status=job['status'],
+        link=job['link'],
+        job_id=job['job_id'],
+    ))
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number above zero."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for options that must be a whole number of zero or more."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be zero or a positive integer, got {value}")
+    return number
 
 
 def cmd_stats(db: JobDatabase, args):
@@ -44,10 +79,7 @@ def cmd_stats(db: JobDatabase, args):
 
 def cmd_list(db: JobDatabase, args):
     """List jobs with filters."""
-    jobs = db.export_jobs_to_dict(active_only=args.active_only)
-    
-    if args.limit:
-        jobs = jobs[:args.limit]
+    jobs = db.list_jobs(active_only=args.active_only, limit=args.limit)
     
     if not jobs:
         print("\n📭 No jobs found matching criteria")
@@ -55,21 +87,28 @@ def cmd_list(db: JobDatabase, args):
     
     print(f"\n📋 Found {len(jobs)} job(s):\n")
     
-    for i, job in enumerate(jobs, 1):
-        if args.compact:
+    if args.compact:
+        lines = []
+        for i, job in enumerate(jobs, 1):
             expired = " ❌" if job.get('expired') else ""
             applied = " ✅" if job.get('applied_on') else ""
-            print(f"{i:3}. {job['title'][:40]:40} | {job['company'][:25]:25}{expired}{applied}")
-        else:
-            print_job(job, i)
+            title = job['title'][:40].ljust(40)
+            company = job['company'][:25].ljust(25)
+            lines.append(f"{i:3}. {title} | {company}{expired}{applied}\n")
+        sys.stdout.writelines(lines)
+        return
+    
+    for i, job in enumerate(jobs, 1):
+        print_job(job, i)
 
 
 def cmd_recent(db: JobDatabase, args):
     """Show jobs added in the last N days."""
+    from datetime import datetime, timedelta
+    
     cutoff_date = (datetime.now() - timedelta(days=args.days)).strftime("%Y-%m-%d")
     
-    jobs = db.export_jobs_to_dict(active_only=True)
-    recent_jobs = [j for j in jobs if j['last_seen'] >= cutoff_date]
+    recent_jobs = db.list_jobs(active_only=True, since=cutoff_date)
     
     if not recent_jobs:
         print(f"\n📭 No jobs found in the last {args.days} day(s)")
@@ -83,15 +122,7 @@ def cmd_recent(db: JobDatabase, args):
 
 def cmd_search(db: JobDatabase, args):
     """Search jobs by keyword."""
-    keyword = args.keyword.lower()
-    jobs = db.export_jobs_to_dict(active_only=args.active_only)
-    
-    matching_jobs = [
-        j for j in jobs
-        if keyword in j['title'].lower() 
-        or keyword in j['company'].lower()
-        or keyword in j['location'].lower()
-    ]
+    matching_jobs = db.search_jobs(args.keyword, active_only=args.active_only)
     
     if not matching_jobs:
         print(f"\n📭 No jobs found matching '{args.keyword}'")
@@ -123,12 +154,24 @@ def cmd_export(db: JobDatabase, args):
     """Export jobs to JSON file."""
     import json
     
-    jobs = db.export_jobs_to_dict(active_only=args.active_only)
-    
+    # Write one job at a time so memory use doesn't grow with the database;
+    # the output is the same as json.dump(jobs, f, indent=2)
+    count = 0
     with open(args.output, 'w') as f:
-        json.dump(jobs, f, indent=2)
+        if args.ndjson:
+            # One compact JSON object per line, for jq or pandas.read_json(lines=True)
+            for job in db.iter_jobs(active_only=args.active_only):
+                f.write(json.dumps(job) + '\n')
+                count += 1
+        else:
+            f.write('[')
+            for job in db.iter_jobs(active_only=args.active_only):
+                f.write(',' if count else '')
+                f.write('\n  ' + json.dumps(job, indent=2).replace('\n', '\n  '))
+                count += 1
+            f.write('\n]' if count else ']')
     
-    print(f"\n✅ Exported {len(jobs)} job(s) to {args.output}")
+    print(f"\n✅ Exported {count} job(s) to {args.output}")
 
 
 def main():
@@ -145,6 +188,7 @@ Examples:
   %(prog)s search "python"          # Search for Python jobs
   %(prog)s show 1234567890          # Show specific job by ID
   %(prog)s export jobs.json         # Export all active jobs to JSON
+  %(prog)s export jobs.ndjson --ndjson  # Export as newline-delimited JSON
         """
     )
     
@@ -161,7 +205,7 @@ Examples:
     
     # List command
     list_parser = subparsers.add_parser('list', help='List all jobs')
-    list_parser.add_argument('--limit', type=int, help='Limit number of results')
+    list_parser.add_argument('--limit', type=positive_int, help='Limit number of results')
     list_parser.add_argument('--compact', action='store_true', help='Compact output')
     list_parser.add_argument('--active-only', action='store_true', default=True,
                            help='Show only active jobs (default: True)')
@@ -170,7 +214,7 @@ Examples:
     
     # Recent command
     recent_parser = subparsers.add_parser('recent', help='Show recently added jobs')
-    recent_parser.add_argument('--days', type=int, default=7,
+    recent_parser.add_argument('--days', type=non_negative_int, default=7,
                              help='Number of days to look back (default: 7)')
     
     # Search command
@@ -192,6 +236,8 @@ Examples:
                               help='Export only active jobs (default: True)')
     export_parser.add_argument('--all', dest='active_only', action='store_false',
                               help='Export all jobs including expired')
+    export_parser.add_argument('--ndjson', action='store_true',
+                              help='Write one JSON object per line instead of a JSON array')
     
     args = parser.parse_args()
     
@@ -199,7 +245,9 @@ Examples:
         parser.print_help()
         return 1
     
-    # Initialize database
+    # Initialize database; imported here so --help doesn't load sqlite3
+    from database import JobDatabase
+    
     try:
         db = JobDatabase(args.db)
     except Exception as e:
@@ -224,6 +272,8 @@ Examples:
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        db.close()
 
 
 if __name__ == "__main__":